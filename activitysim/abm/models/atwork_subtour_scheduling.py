@@ -12,6 +12,7 @@ from activitysim.core import config
 from activitysim.core import inject
 from activitysim.core import timetable as tt
 from .util.vectorize_tour_scheduling import vectorize_subtour_scheduling
+from .util.vectorize_tour_scheduling import tdd_choices_df
 from .util.expressions import annotate_preprocessors
 
 from .util import estimation
@@ -98,7 +99,7 @@ def atwork_subtour_scheduling(
 
     # choices are tdd alternative ids
     # we want to add start, end, and duration columns to tours, which we have in tdd_alts table
-    tdd_choices = pd.merge(choices.to_frame('tdd'), tdd_alts, left_on=['tdd'], right_index=True, how='left')
+    tdd_choices = tdd_choices_df(choices, tdd_alts)
 
     assign_in_place(tours, tdd_choices)
     pipeline.replace_table("tours", tours)
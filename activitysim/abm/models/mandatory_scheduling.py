@@ -138,7 +138,7 @@ def mandatory_tour_scheduling(tours,
 
     # choices are tdd alternative ids
     # we want to add start, end, and duration columns to tours, which we have in tdd_alts table
-    choices = pd.merge(choices.to_frame('tdd'), tdd_alts, left_on=['tdd'], right_index=True, how='left')
+    choices = vts.tdd_choices_df(choices, tdd_alts)
 
     assign_in_place(tours, choices)
     pipeline.replace_table("tours", tours)
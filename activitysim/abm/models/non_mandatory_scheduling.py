@@ -2,8 +2,6 @@
 # See full license in LICENSE.txt.
 import logging
 
-import pandas as pd
-
 from activitysim.core import tracing
 from activitysim.core import config
 from activitysim.core import inject
@@ -15,6 +13,7 @@ from .util import expressions
 from .util import estimation
 
 from .util.vectorize_tour_scheduling import vectorize_tour_scheduling
+from .util.vectorize_tour_scheduling import tdd_choices_df
 from activitysim.core.util import assign_in_place
 
 
@@ -108,7 +107,7 @@ def non_mandatory_tour_scheduling(tours,
 
     # choices are tdd alternative ids
     # we want to add start, end, and duration columns to tours, which we have in tdd_alts table
-    choices = pd.merge(choices.to_frame('tdd'), tdd_alts, left_on=['tdd'], right_index=True, how='left')
+    choices = tdd_choices_df(choices, tdd_alts)
 
     assign_in_place(tours, choices)
     pipeline.replace_table("tours", tours)
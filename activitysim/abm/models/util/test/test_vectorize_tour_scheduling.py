@@ -11,7 +11,7 @@ import pandas.testing as pdt
 from activitysim.core import inject
 
 from ..vectorize_tour_scheduling import get_previous_tour_by_tourid, \
-    vectorize_tour_scheduling
+    tdd_choices_df, vectorize_tour_scheduling
 
 
 def test_vts():
@@ -73,7 +73,31 @@ def test_vts():
 
     # FIXME - dead reckoning regression
     # there's no real logic here - this is just what came out of the monte carlo
-    # note that the result comes out ordered by the nth trips and not ordered
-    # by the trip index.  shrug?
-    expected = [2, 2, 2, 0, 0]
+    # note that the result comes out ordered by the tour index (not by the nth trips)
+    expected = [2, 0, 2, 2, 0]
+    assert (tdd_choices.index == tours.index).all()
+    assert tdd_choices.name == 'tdd'
     assert (tdd_choices.values == expected).all()
+
+
+def test_tdd_choices_df():
+
+    alts = pd.DataFrame({
+        "start": [1, 1, 2, 3],
+        "end": [1, 4, 5, 6]
+    })
+    alts['duration'] = alts.end - alts.start
+
+    # unsorted tour ids with repeated tdd choices
+    choices = pd.Series([3, 0, 3, 1], index=pd.Index([30, 10, 20, 40], name='tour_id'))
+
+    tdd_choices = tdd_choices_df(choices, alts)
+
+    # should match the merge it replaced (columns in same order, same index and dtypes)
+    expected = pd.merge(choices.to_frame('tdd'), alts, left_on=['tdd'], right_index=True, how='left')
+    assert list(tdd_choices.columns) == ['tdd', 'start', 'end', 'duration']
+    pdt.assert_frame_equal(tdd_choices, expected)
+
+    # every choice must be a tdd alt
+    with pytest.raises(AssertionError):
+        tdd_choices_df(pd.Series([0, 4], index=[10, 20]), alts)
@@ -19,6 +19,7 @@ from activitysim.core import logit
 from activitysim.core import timetable as tt
 
 from activitysim.core.util import reindex
+from activitysim.core.util import iter_groups
 
 from . import expressions
 from . import mode
@@ -161,9 +162,45 @@ def compute_logsums(alt_tdd, tours_merged, tour_purpose, model_settings, trace_l
     return logsums
 
 
+def get_alts_cols(alts):
+    """
+    Return dict of contiguous numpy arrays for each alts column, keyed by column name
+
+    alts are indexed (via ndarray.take) for every tour and chunk scheduled, so we extract
+    the column arrays just once rather than going through the DataFrame for each access.
+    """
+    return {c: np.ascontiguousarray(alts[c].values) for c in alts.columns}
+
+
+def init_previous_tour(owner_ids, alts):
+    """
+    Create previous_tour series with one tdd alt per tour owner, initialized to first alt
+
+    The series is just an owner id index over a typed numpy array - get_previous_tour_by_tourid
+    and _schedule_tours read and write its values positionally rather than via .loc
+
+    Parameters
+    ----------
+    owner_ids : array-like
+        tour owner ids (e.g. person_id) - need not be unique
+    alts : DataFrame
+        The alternatives of the scheduling.
+
+    Returns
+    -------
+    previous_tour : Series
+        tdd alt ids indexed by unique owner_ids
+    """
+
+    owner_ids = pd.unique(owner_ids)
+    tdds = np.full(len(owner_ids), alts.index[0], dtype=alts.index.dtype)
+
+    return pd.Series(tdds, index=owner_ids)
+
+
 def get_previous_tour_by_tourid(current_tour_window_ids,
                                 previous_tour_by_window_id,
-                                alts):
+                                alts, alts_cols=None):
     """
     Matches current tours with attributes of previous tours for the same
     person.  See the return value below for more information.
@@ -178,6 +215,8 @@ def get_previous_tour_by_tourid(current_tour_window_ids,
         of the alternatives of the scheduling.
     alts : DataFrame
         The alternatives of the scheduling.
+    alts_cols : dict or None
+        alts column arrays from get_alts_cols (computed on the fly if None)
 
     Returns
     -------
@@ -192,18 +231,55 @@ def get_previous_tour_by_tourid(current_tour_window_ids,
 
     PREV_TOUR_COLUMNS = ['start', 'end']
 
-    previous_tour_by_tourid = \
-        previous_tour_by_window_id.loc[current_tour_window_ids]
+    if alts_cols is None:
+        alts_cols = get_alts_cols(alts)
+
+    # positional (rather than label-based .loc) lookup of previous tour tdd for each current tour
+    row_ixs = previous_tour_by_window_id.index.get_indexer(current_tour_window_ids)
+    assert (row_ixs >= 0).all()
+    previous_tdds = previous_tour_by_window_id.values.take(row_ixs)
 
-    previous_tour_by_tourid = alts.loc[previous_tour_by_tourid, PREV_TOUR_COLUMNS]
+    alt_ixs = alts.index.get_indexer(previous_tdds)
+    assert (alt_ixs >= 0).all()
 
-    previous_tour_by_tourid.index = current_tour_window_ids.index
-    previous_tour_by_tourid.columns = [x+'_previous' for x in PREV_TOUR_COLUMNS]
+    # build with suffixed column names directly rather than renaming columns after the fact
+    previous_tour_by_tourid = pd.DataFrame(
+        {c + '_previous': alts_cols[c].take(alt_ixs) for c in PREV_TOUR_COLUMNS},
+        index=current_tour_window_ids.index)
 
     return previous_tour_by_tourid
 
 
-def tdd_interaction_dataset(tours, alts, timetable, choice_column, window_id_col, trace_label):
+def tdd_choices_df(choices, alts):
+    """
+    Expand tdd alt choices into a DataFrame of the chosen alts' attributes
+
+    Parameters
+    ----------
+    choices : pandas Series
+        tdd alt ids indexed by tour_id
+    alts : pandas DataFrame
+        tdd alts (e.g. with start, end, and duration columns)
+
+    Returns
+    -------
+    tdd_choices : pandas DataFrame
+        columns: tdd, and one column for each alts column
+        index: choices.index
+    """
+
+    alt_ixs = alts.index.get_indexer(choices.values)
+    assert (alt_ixs >= 0).all()
+
+    tdd_cols = {TDD_CHOICE_COLUMN: choices.values}
+    for c in alts.columns:
+        tdd_cols[c] = alts[c].values.take(alt_ixs)
+
+    return pd.DataFrame(tdd_cols, index=choices.index)
+
+
+def tdd_interaction_dataset(tours, alts, timetable, choice_column, window_id_col, trace_label,
+                            alts_cols=None):
     """
     interaction_sample_simulate expects
     alts index same as choosers (e.g. tour_id)
@@ -219,6 +295,8 @@ def tdd_interaction_dataset(tours, alts, timetable, choice_column, window_id_col
     choice_column : str
         name of column to store alt index in alt_tdd DataFrame
         (since alt_tdd is duplicate index on person_id but unique on person_id,alt_id)
+    alts_cols : dict or None
+        alts column arrays from get_alts_cols (computed on the fly if None)
 
     Returns
     -------
@@ -229,30 +307,72 @@ def tdd_interaction_dataset(tours, alts, timetable, choice_column, window_id_col
 
     """
 
-    alts_ids = np.tile(alts.index, len(tours.index))
-    tour_ids = np.repeat(tours.index, len(alts.index))
-    window_row_ids = np.repeat(tours[window_id_col], len(alts.index))
+    if alts_cols is None:
+        alts_cols = get_alts_cols(alts)
+
+    n_tours = len(tours.index)
+    n_alts = len(alts.index)
+
+    # int32 timetable windows row index for each tour
+    # (so we only map window_row_ids once per tour rather than once per tour and alt pair)
+    window_row_ixs = timetable.get_window_row_ixs(tours[window_id_col])
 
-    alt_tdd = alts.take(alts_ids)
+    # - check availability before building the dataset
+    # so we only materialize alt columns for the (usually much smaller) available subset
+    # shape (n_tours, n_alts) - computed once per distinct window rather than once per tour
+    available = timetable.tour_available_matrix(window_row_ixs, alts.index.values)
+    assert available.any()
 
-    alt_tdd.index = tour_ids
-    alt_tdd[window_id_col] = window_row_ids
+    # flat (tour, alt) pair indexes of the available pairs
+    # tour and alt positions derive from these, so we never build n_tours * n_alts id arrays
+    keep = np.flatnonzero(available)
+    alt_ixs = keep % n_alts
+    tour_ids = pd.Index(tours.index.values.take(keep // n_alts), name=tours.index.name)
 
     # add tdd alternative id
     # by convention, the choice column is the first column in the interaction dataset
-    alt_tdd.insert(loc=0, column=choice_column, value=alts_ids)
-
-    # slice out all non-available tours
-    available = timetable.tour_available(alt_tdd[window_id_col], alt_tdd[choice_column])
-    assert available.any()
-    alt_tdd = alt_tdd[available]
+    alt_cols = {choice_column: alts.index.values.take(alt_ixs)}
+    for c, values in alts_cols.items():
+        alt_cols[c] = values.take(alt_ixs)
 
-    # FIXME - don't need this any more after slicing
-    del alt_tdd[window_id_col]
+    # every column is a fresh array taken above, so no need to copy them again
+    # alt_tdd doesn't share data with alts or tours, so callers are free to add columns in place
+    # (compute_logsums adds period columns and mode_choice_logsum, and interaction_sample_simulate
+    # adds an index column when there are skims) without a defensive copy
+    alt_tdd = pd.DataFrame(alt_cols, index=tour_ids, copy=False)
 
     return alt_tdd
 
 
+def merge_persons(tours, persons_merged):
+    """
+    merge persons_merged columns into tours, joining on tours.person_id
+
+    Parameters
+    ----------
+    tours : DataFrame
+        must have person_id column
+    persons_merged : DataFrame
+        indexed by person_id
+
+    Returns
+    -------
+    tours : DataFrame
+        tours with persons_merged columns appended (in original tours order)
+    """
+
+    # positional take of persons_merged rows is much cheaper than pd.merge hash join
+    person_ixs = persons_merged.index.get_indexer(tours['person_id'])
+    assert (person_ixs >= 0).all()
+    person_rows = persons_merged.take(person_ixs)
+    person_rows.index = tours.index
+
+    # avoid dual suffix for redundant columns names (e.g. household_id) that appear in both
+    person_rows.columns = [c + '_y' if c in tours.columns else c for c in person_rows.columns]
+
+    return pd.concat([tours, person_rows], axis=1, copy=False)
+
+
 def _schedule_tours(
         tours, persons_merged, alts,
         spec, logsum_tour_purpose,
@@ -260,7 +380,7 @@ def _schedule_tours(
         timetable, window_id_col,
         previous_tour, tour_owner_id_col,
         estimator,
-        tour_trace_label):
+        tour_trace_label, alts_cols=None):
     """
     previous_tour stores values used to add columns that can be used in the spec
     which have to do with the previous tours per person.  Every column in the
@@ -275,9 +395,9 @@ def _schedule_tours(
     ----------
     tours : DataFrame
         chunk of tours to schedule with unique timetable window_id_col
-    persons_merged : DataFrame
+    persons_merged : DataFrame or None
         DataFrame of persons to be merged with tours containing attributes referenced
-        by expressions in spec
+        by expressions in spec (None if they have already been merged into tours)
     alts : DataFrame
         DataFrame of alternatives which represent all possible time slots.
         tdd_interaction_dataset function will use timetable to filter them to omit
@@ -299,6 +419,8 @@ def _schedule_tours(
         (person_id for non/mandatory tours, parent_tour_id for subtours,
         household_id for joint_tours)
     tour_trace_label
+    alts_cols : dict or None
+        alts column arrays from get_alts_cols (computed on the fly if None)
 
     Returns
     -------
@@ -307,11 +429,10 @@ def _schedule_tours(
 
     logger.info("%s schedule_tours running %d tour choices" % (tour_trace_label, len(tours)))
 
-    # merge persons into tours
-    # avoid dual suffix for redundant columns names (e.g. household_id) that appear in both
-    tours = pd.merge(tours, persons_merged, left_on='person_id', right_index=True,
-                     suffixes=('', '_y'))
-    chunk.log_df(tour_trace_label, "tours", tours)
+    # merge persons into tours (unless caller already did so and passed persons_merged None)
+    if persons_merged is not None:
+        tours = merge_persons(tours, persons_merged)
+        chunk.log_df(tour_trace_label, "tours", tours)
 
     # - add explicit window_id_col for timetable owner if it is index
     # if no timetable window_id_col specified, then add index as an explicit column
@@ -321,14 +442,14 @@ def _schedule_tours(
         tours[window_id_col] = tours.index
 
     # timetable can't handle multiple tours per window_id
-    assert not tours[window_id_col].duplicated().any()
+    assert tours[window_id_col].is_unique
 
     # - build interaction dataset filtered to include only available tdd alts
     # dataframe columns start, end , duration, person_id, tdd
     # indexed (not unique) on tour_id
     choice_column = TDD_CHOICE_COLUMN
     alt_tdd = tdd_interaction_dataset(tours, alts, timetable, choice_column, window_id_col,
-                                      tour_trace_label)
+                                      tour_trace_label, alts_cols=alts_cols)
     chunk.log_df(tour_trace_label, "alt_tdd", alt_tdd)
 
     # - add logsums
@@ -342,7 +463,8 @@ def _schedule_tours(
     # - merge in previous tour columns
     # adds start_previous and end_previous, joins on index
     tours = \
-        tours.join(get_previous_tour_by_tourid(tours[tour_owner_id_col], previous_tour, alts))
+        tours.join(get_previous_tour_by_tourid(tours[tour_owner_id_col], previous_tour, alts,
+                                               alts_cols=alts_cols))
     chunk.log_df(tour_trace_label, "tours", tours)
 
     # - make choices
@@ -373,7 +495,11 @@ def _schedule_tours(
     # - update previous_tour and timetable parameters
 
     # update previous_tour (series with most recent previous tdd choices) with latest values
-    previous_tour.loc[tours[tour_owner_id_col]] = choices.values
+    # positional write into the underlying array (tour owners are unique within each call)
+    # avoids the label alignment overhead of previous_tour.loc[] assignment
+    row_ixs = previous_tour.index.get_indexer(tours[tour_owner_id_col])
+    assert (row_ixs >= 0).all()
+    previous_tour.values[row_ixs] = choices.values
 
     # update timetable with chosen tdd footprints
     timetable.assign(tours[window_id_col], choices)
@@ -392,8 +518,8 @@ def calc_rows_per_chunk(chunk_size, tours, persons_merged, alternatives, model_s
     chooser_row_size = tours.shape[1]
     sample_size = alternatives.shape[0]
 
-    # persons_merged columns plus 2 previous tour columns
-    extra_chooser_columns = persons_merged.shape[1] + 2
+    # persons_merged columns (unless already merged into tours) plus 2 previous tour columns
+    extra_chooser_columns = 2 if persons_merged is None else persons_merged.shape[1] + 2
 
     # one column per alternative plus skim and join columns
     alt_row_size = alternatives.shape[1] + 2
@@ -434,7 +560,7 @@ def schedule_tours(
         timetable, timetable_window_id_col,
         previous_tour, tour_owner_id_col,
         estimator,
-        chunk_size, tour_trace_label):
+        chunk_size, tour_trace_label, alts_cols=None):
     """
     chunking wrapper for _schedule_tours
 
@@ -443,6 +569,10 @@ def schedule_tours(
     the chunking loop to minimize memory footprint. So we implement the chunking loop here,
     and pass a chunk_size of 0 to interaction_sample_simulate to disable its chunking support.
 
+    If persons_merged is None, tours must already have persons_merged columns merged in
+    (vectorize_tour_scheduling does this once when not chunking, so only the
+    tdd_interaction_dataset is built per chunk).
+
     """
 
     if not tours.index.is_monotonic_increasing:
@@ -453,9 +583,9 @@ def schedule_tours(
 
     # no more than one tour per timetable_window per call
     if timetable_window_id_col is None:
-        assert not tours.index.duplicated().any()
+        assert tours.index.is_unique
     else:
-        assert not tours[timetable_window_id_col].duplicated().any()
+        assert tours[timetable_window_id_col].is_unique
 
     rows_per_chunk, effective_chunk_size = \
         calc_rows_per_chunk(chunk_size, tours, persons_merged, alts,
@@ -477,7 +607,8 @@ def schedule_tours(
                                   timetable, timetable_window_id_col,
                                   previous_tour, tour_owner_id_col,
                                   estimator,
-                                  tour_trace_label=chunk_trace_label)
+                                  tour_trace_label=chunk_trace_label,
+                                  alts_cols=alts_cols)
 
         chunk.log_close(chunk_trace_label)
 
@@ -546,64 +677,94 @@ def vectorize_tour_scheduling(tours, persons_merged, alts, timetable,
     assert 'tour_num' in tours.columns
     assert 'tour_type' in tours.columns
 
+    assert isinstance(tour_segments, dict)
+
+    # tours in segments without a spec are not scheduled (and have no choices)
+    if tour_segment_col is not None:
+        unspecified = ~tours[tour_segment_col].isin(list(tour_segments.keys()))
+        if unspecified.any():
+            logger.info("%s skipping %s tours in unspecified segments %s" %
+                        (trace_label, unspecified.sum(),
+                         tours[tour_segment_col][unspecified].unique().tolist()))
+            tours = tours[~unspecified]
+
     # tours must be scheduled in increasing trip_num order
     # second trip of type must be in group immediately following first
     # this ought to have been ensured when tours are created (tour_frequency.process_tours)
-    choice_list = []
+
+    # preallocate choices (in tours order) and fill them in as each schedule_tours call returns
+    # rather than appending them to a list and paying for pd.concat at the end
+    tdd_choices = np.empty(len(tours.index), dtype=alts.index.dtype)
+    # so we can check that every tour got a choice
+    scheduled = np.zeros(len(tours.index), dtype=bool)
 
     # keep a series of the the most recent tours for each person
     # initialize with first trip from alts
-    previous_tour_by_personid = pd.Series(alts.index[0], index=tours.person_id.unique())
+    previous_tour_by_personid = init_previous_tour(tours.person_id, alts)
+
+    alts_cols = get_alts_cols(alts)
+
+    # person attributes don't change between tour_nums, so if we aren't chunking, merge them into
+    # tours just once (rather than once per schedule_tours call) and pass persons_merged None.
+    # If we are chunking, the merged frame is too big to build for all tours up front,
+    # so leave it to schedule_tours to merge each chunk.
+    if chunk_size == 0:
+        tours = merge_persons(tours, persons_merged)
+        persons_merged = None
 
     timetable_window_id_col = 'person_id'
     tour_owner_id_col = 'person_id'
     compute_logsums = ('LOGSUM_SETTINGS' in model_settings)
 
-    assert isinstance(tour_segments, dict)
-
     # no more than one tour per person per call to schedule_tours
     # tours must be scheduled in increasing trip_num order
     # second trip of type must be in group immediately following first
     # segregate scheduling by tour_type if multiple specs passed in dict keyed by tour_type
 
-    for tour_num, nth_tours in tours.groupby('tour_num', sort=True):
+    if tour_segment_col is not None:
 
-        tour_trace_label = tracing.extend_trace_label(trace_label, 'tour_%s' % (tour_num,))
+        # single pass over (tour_num, segment) groups rather than masking each tour_num by segment
+        # groups are sorted so tour_nums are still scheduled in increasing order
+        # (a person has at most one tour per tour_num, so order of segments within tour_num is moot)
+        for (tour_num, tour_segment_name), nth_tours_in_segment in \
+                iter_groups(tours, ['tour_num', tour_segment_col]):
 
-        if tour_segment_col is not None:
+            tour_trace_label = tracing.extend_trace_label(trace_label, 'tour_%s' % (tour_num,))
+            segment_trace_label = tracing.extend_trace_label(tour_trace_label, tour_segment_name)
 
-            for tour_segment_name, tour_segment_info in tour_segments.items():
+            tour_segment_info = tour_segments[tour_segment_name]
 
-                segment_trace_label = tracing.extend_trace_label(tour_trace_label, tour_segment_name)
+            # assume segmentation of spec and logsum coefficients are aligned
+            spec_segment_name = tour_segment_info.get('spec_segment_name')
+            logsum_tour_purpose = spec_segment_name if compute_logsums else None
 
-                # assume segmentation of spec and logsum coefficients are aligned
-                spec_segment_name = tour_segment_info.get('spec_segment_name')
-                logsum_tour_purpose = spec_segment_name if compute_logsums else None
+            choices = \
+                schedule_tours(nth_tours_in_segment, persons_merged, alts,
+                               spec=tour_segment_info['spec'],
+                               logsum_tour_purpose=logsum_tour_purpose,
+                               model_settings=model_settings,
+                               timetable=timetable,
+                               timetable_window_id_col=timetable_window_id_col,
+                               previous_tour=previous_tour_by_personid,
+                               tour_owner_id_col=tour_owner_id_col,
+                               estimator=tour_segment_info.get('estimator'),
+                               chunk_size=chunk_size,
+                               tour_trace_label=segment_trace_label,
+                               alts_cols=alts_cols)
 
-                nth_tours_in_segment = nth_tours[nth_tours[tour_segment_col] == tour_segment_name]
-                if nth_tours_in_segment.empty:
-                    logger.info("skipping empty segment %s" % tour_segment_name)
-                    continue
+            choice_ixs = tours.index.get_indexer(choices.index)
+            assert (choice_ixs >= 0).all()
+            tdd_choices[choice_ixs] = choices.values
+            scheduled[choice_ixs] = True
 
-                choices = \
-                    schedule_tours(nth_tours_in_segment, persons_merged, alts,
-                                   spec=tour_segment_info['spec'],
-                                   logsum_tour_purpose=logsum_tour_purpose,
-                                   model_settings=model_settings,
-                                   timetable=timetable,
-                                   timetable_window_id_col=timetable_window_id_col,
-                                   previous_tour=previous_tour_by_personid,
-                                   tour_owner_id_col=tour_owner_id_col,
-                                   estimator=tour_segment_info.get('estimator'),
-                                   chunk_size=chunk_size,
-                                   tour_trace_label=segment_trace_label)
+    else:
 
-                choice_list.append(choices)
+        assert not compute_logsums, "logsums for unsegmented spec not implemented because not currently needed"
+        assert tour_segments.get('spec_segment_name') is None
 
-        else:
+        for tour_num, nth_tours in iter_groups(tours, 'tour_num'):
 
-            assert not compute_logsums, "logsums for unsegmented spec not implemented because not currently needed"
-            assert tour_segments.get('spec_segment_name') is None
+            tour_trace_label = tracing.extend_trace_label(trace_label, 'tour_%s' % (tour_num,))
 
             choices = \
                 schedule_tours(nth_tours, persons_merged, alts,
@@ -616,11 +777,17 @@ def vectorize_tour_scheduling(tours, persons_merged, alts, timetable,
                                tour_owner_id_col=tour_owner_id_col,
                                estimator=tour_segments.get('estimator'),
                                chunk_size=chunk_size,
-                               tour_trace_label=tour_trace_label)
+                               tour_trace_label=tour_trace_label,
+                               alts_cols=alts_cols)
 
-            choice_list.append(choices)
+            choice_ixs = tours.index.get_indexer(choices.index)
+            assert (choice_ixs >= 0).all()
+            tdd_choices[choice_ixs] = choices.values
+            scheduled[choice_ixs] = True
 
-    choices = pd.concat(choice_list)
+    assert scheduled.all()
+
+    choices = pd.Series(tdd_choices, index=tours.index, name=TDD_CHOICE_COLUMN)
     return choices
 
 
@@ -692,19 +859,20 @@ def vectorize_subtour_scheduling(parent_tours, subtours, persons_merged, alts, s
 
     # keep a series of the the most recent tours for each person
     # initialize with first trip from alts
-    previous_tour_by_parent_tour_id = \
-        pd.Series(alts.index[0], index=subtours['parent_tour_id'].unique())
+    previous_tour_by_parent_tour_id = init_previous_tour(subtours['parent_tour_id'], alts)
+
+    alts_cols = get_alts_cols(alts)
 
     # tours must be scheduled in increasing trip_num order
     # second trip of type must be in group immediately following first
     # this ought to have been ensured when tours are created (tour_frequency.process_tours)
 
-    for tour_num, nth_tours in subtours.groupby('tour_num', sort=True):
+    for tour_num, nth_tours in iter_groups(subtours, 'tour_num'):
 
         tour_trace_label = tracing.extend_trace_label(trace_label, 'tour_%s' % (tour_num,))
 
         # no more than one tour per timetable window per call to schedule_tours
-        assert not nth_tours.parent_tour_id.duplicated().any()
+        assert nth_tours.parent_tour_id.is_unique
 
         choices = \
             schedule_tours(nth_tours,
@@ -714,7 +882,7 @@ def vectorize_subtour_scheduling(parent_tours, subtours, persons_merged, alts, s
                            timetable, timetable_window_id_col,
                            previous_tour_by_parent_tour_id, tour_owner_id_col,
                            estimator,
-                           chunk_size, tour_trace_label)
+                           chunk_size, tour_trace_label, alts_cols=alts_cols)
 
         choice_list.append(choices)
 
@@ -802,7 +970,9 @@ def vectorize_joint_tour_scheduling(
 
     # keep a series of the the most recent tours for each person
     # initialize with first trip from alts
-    previous_tour_by_householdid = pd.Series(alts.index[0], index=joint_tours.household_id.unique())
+    previous_tour_by_householdid = init_previous_tour(joint_tours.household_id, alts)
+
+    alts_cols = get_alts_cols(alts)
 
     # tours must be scheduled in increasing trip_num order
     # second trip of type must be in group immediately following first
@@ -811,12 +981,12 @@ def vectorize_joint_tour_scheduling(
     # print "participant windows before scheduling\n%s" % \
     #     persons_timetable.slice_windows_by_row_id(joint_tour_participants.person_id)
 
-    for tour_num, nth_tours in joint_tours.groupby('tour_num', sort=True):
+    for tour_num, nth_tours in iter_groups(joint_tours, 'tour_num'):
 
         tour_trace_label = tracing.extend_trace_label(trace_label, 'tour_%s' % (tour_num,))
 
         # no more than one tour per household per call to schedule_tours
-        assert not nth_tours.household_id.duplicated().any()
+        assert nth_tours.household_id.is_unique
 
         nth_participants = \
             joint_tour_participants[joint_tour_participants.tour_id.isin(nth_tours.index)]
@@ -833,7 +1003,7 @@ def vectorize_joint_tour_scheduling(
                            timetable, timetable_window_id_col,
                            previous_tour_by_householdid, tour_owner_id_col,
                            estimator,
-                           chunk_size, tour_trace_label)
+                           chunk_size, tour_trace_label, alts_cols=alts_cols)
 
         # - update timetables of all joint tour participants
         persons_timetable.assign(
@@ -37,12 +37,26 @@ def tdd_alts():
     return alts
 
 
-def test_basic(persons, tdd_alts):
+@pytest.fixture(params=['numba', 'numpy'])
+def tour_available_impl(request, monkeypatch):
+    # run tests with both numba kernel (if available) and numpy implementation of tour_available
+    if request.param == 'numba' and tt._tour_available is None:
+        pytest.skip("numba not installed")
+    if request.param == 'numpy':
+        monkeypatch.setattr(tt, '_tour_available', None)
+        monkeypatch.setattr(tt, '_tour_available_matrix', None)
+    return request.param
+
+
+def test_basic(persons, tdd_alts, tour_available_impl):
 
     person_windows = tt.create_timetable_windows(persons, tdd_alts)
 
     timetable = tt.TimeTable(person_windows, tdd_alts, 'person_windows')
 
+    # window_bits are built lazily by the first availability check
+    assert timetable.window_bits is None
+
     # print "\ntdd_footprints_df\n", timetable.tdd_footprints_df
     #     0  1  2  3  4  5  6  7
     # 0   0  6  0  0  0  0  0  0
@@ -129,6 +143,14 @@ def test_basic(persons, tdd_alts):
     pdt.assert_series_equal(timetable.tour_available(person_ids, tdds),
                             pd.Series([True, True, False, False], index=person_ids.index))
 
+    # tour_available_matrix should agree with tour_available for every person and tdd
+    available = timetable.tour_available_matrix(np.arange(num_persons), np.arange(num_alts))
+    assert available.shape == (num_persons, num_alts)
+    person_ids = pd.Series(np.repeat(list(range(num_persons)), num_alts))
+    tdds = pd.Series(list(range(num_alts)) * num_persons)
+    assert (timetable.tour_available(person_ids, tdds).values == available.ravel()).all()
+    assert not available.all()
+
     # assigning overlapping trip END,START should convert END to START_END
     person_ids = pd.Series([2])
     tdds = pd.Series([13])
@@ -137,6 +159,9 @@ def test_basic(persons, tdd_alts):
     timetable.assign(person_ids, tdds)
     assert timetable.windows[2, 3] == tt.I_START_END
 
+    # incrementally updated window_bits should match window_bits packed from scratch
+    assert (timetable.get_window_bits() == timetable.pack_window_bits(timetable.windows)).all()
+
     # print "\nupdated_person_windows\n", timetable.get_person_windows_df()
     #    4  5  6  7  8  9  10  11
     # 0  0  6  0  0  0  0   0   0
@@ -184,3 +209,44 @@ def test_basic(persons, tdd_alts):
     ends = pd.Series([10, 10, 10, 9])
     periods_available = timetable.remaining_periods_available(person_ids, starts, ends)
     pdt.assert_series_equal(periods_available, pd.Series([6, 3, 4, 3]))
+
+
+def test_tour_available_bad_ids(persons, tdd_alts, tour_available_impl):
+
+    person_windows = tt.create_timetable_windows(persons, tdd_alts)
+    timetable = tt.TimeTable(person_windows, tdd_alts, 'person_windows')
+
+    num_alts = len(tdd_alts.index)
+
+    # out of range tdds should raise rather than read outside tdd footprints
+    for bad_tdd in [num_alts, 10**6, -3]:
+        with pytest.raises(AssertionError):
+            timetable.tour_available(pd.Series([1, 2, 3]), pd.Series([0, bad_tdd, 1]))
+
+    # and so should out of range window row indexes
+    with pytest.raises(AssertionError):
+        timetable.tour_available_by_row_ix(np.array([0, len(persons.index)]), np.array([0, 1]))
+
+
+def test_pack_bits():
+
+    bits = np.zeros((2, 70), dtype=bool)
+    bits[0, [0, 3, 63]] = True
+    bits[1, [1, 64, 69]] = True
+
+    packed = tt.pack_bits(bits)
+
+    assert packed.dtype == np.uint64
+    assert packed.shape == (2, 2)
+    assert packed[0, 0] == (1 << 0) | (1 << 3) | (1 << 63)
+    assert packed[0, 1] == 0
+    assert packed[1, 0] == (1 << 1)
+    assert packed[1, 1] == (1 << 0) | (1 << 5)
+
+    # compare with reference shift and or at word boundary and multi-word period counts
+    for num_periods in [19, 64, 130]:
+        bits = np.random.RandomState(num_periods).rand(5, num_periods) > 0.5
+        expected = np.zeros((5, (num_periods + 63) // 64), dtype=np.uint64)
+        for i in range(num_periods):
+            expected[:, i // 64] |= bits[:, i].astype(np.uint64) << np.uint64(i % 64)
+        assert (tt.pack_bits(bits) == expected).all()
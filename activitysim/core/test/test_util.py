@@ -10,6 +10,7 @@ from ..util import reindex
 from ..util import other_than
 from ..util import quick_loc_series
 from ..util import quick_loc_df
+from ..util import iter_groups
 
 
 @pytest.fixture(scope='module')
@@ -57,3 +58,19 @@ def test_quick_loc_series():
 
     assert list(quick_loc_series(loc_list, series)) == attrib_list
     assert list(quick_loc_series(loc_list, series)) == list(series.loc[loc_list])
+
+
+def test_iter_groups(people):
+
+    # shuffled so groups are not contiguous in df
+    df = people.iloc[[5, 0, 9, 3, 1, 7, 2, 8, 6, 4]]
+
+    for by in ['household', ['household', 'ptype']]:
+        expected = list(df.groupby(by, sort=True))
+        groups = list(iter_groups(df, by))
+
+        assert [k for k, g in groups] == [k for k, g in expected]
+        for (k, g), (ek, eg) in zip(groups, expected):
+            pdt.assert_frame_equal(g, eg)
+
+    assert list(iter_groups(df.iloc[0:0], 'household')) == []
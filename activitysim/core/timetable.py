@@ -9,6 +9,11 @@ import logging
 import numpy as np
 import pandas as pd
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
 from activitysim.core import config
 from activitysim.core import pipeline
 from activitysim.core import tracing
@@ -40,6 +45,18 @@ COLLISIONS = [
 
 COLLISION_LIST = [a + (b << I_BIT_SHIFT) for a, b in COLLISIONS]
 
+# lookup table version of COLLISIONS indexed by [window_state, tdd_footprint_state]
+COLLISION_TABLE = np.zeros((I_MIDDLE + 1, I_MIDDLE + 1), dtype=bool)
+for a, b in COLLISIONS:
+    COLLISION_TABLE[b, a] = True
+
+# tdd footprint states that can collide with some window state
+# for bit-packed collision checks, we pack one bitmap of periods per BIT_STATE
+# footprint bitmap k has bits set for periods where the footprint is in BIT_STATES[k]
+# window bitmap k has bits set for periods where window state would collide with BIT_STATES[k]
+# so a footprint collides with a window if (footprint_bits & window_bits) is nonzero for any k
+BIT_STATES = [s for s in range(I_MIDDLE + 1) if COLLISION_TABLE[:, s].any()]
+
 
 # str versions of time windows period states
 C_EMPTY = str(I_EMPTY)
@@ -49,6 +66,71 @@ C_MIDDLE = str(I_MIDDLE)
 C_START_END = str(I_START_END)
 
 
+# lookup table of bytes with bit order reversed (for converting big-endian np.packbits output)
+REVERSED_BYTE_BITS = np.array([int('{:08b}'.format(b)[::-1], 2) for b in range(256)], dtype=np.uint8)
+
+
+def pack_bits(bits):
+    """
+    pack 2D bool array with one column per period into uint64 bitmaps (period i is bit i % 64
+    of word i // 64) with shape (num_rows, num_words)
+    """
+
+    num_rows, num_periods = bits.shape
+    num_words = (num_periods + 63) // 64
+
+    # one byte per 8 periods (period i is bit i % 8 of byte i // 8)
+    # np.packbits packs big-endian bit order (bitorder='little' needs numpy 1.17)
+    # so reverse the bits of each packed byte
+    packed = REVERSED_BYTE_BITS[np.packbits(bits, axis=1)]
+
+    # pad to whole words so little-endian bytes view as uint64 words
+    padded = np.zeros((num_rows, num_words * 8), dtype=np.uint8)
+    padded[:, :packed.shape[1]] = packed
+
+    return padded.view('<u8').astype(np.uint64, copy=False)
+
+
+def _tour_available(row_ixs, tdds, window_bits, tdd_footprint_bits, available):
+    """
+    numba kernel for TimeTable.tour_available
+
+    sets available[i] to False if tdd_footprint_bits[tdds[i]] collides with
+    window_bits[row_ixs[i]] (both with shape (len(BIT_STATES), num_words) per row)
+    """
+    for i in numba.prange(len(row_ixs)):
+        window = window_bits[row_ixs[i]]
+        footprint = tdd_footprint_bits[tdds[i]]
+        collisions = np.uint64(0)
+        for k in range(window.shape[0]):
+            for w in range(window.shape[1]):
+                collisions |= window[k, w] & footprint[k, w]
+        available[i] = (collisions == 0)
+
+
+def _tour_available_matrix(window_bits, tdd_footprint_bits, available):
+    """
+    numba kernel for TimeTable.tour_available_matrix
+
+    sets available[i, j] to False if tdd_footprint_bits[j] collides with window_bits[i]
+    (both flattened to len(BIT_STATES) * num_words words per row)
+    """
+    for i in numba.prange(window_bits.shape[0]):
+        for j in range(tdd_footprint_bits.shape[0]):
+            collisions = np.uint64(0)
+            for w in range(window_bits.shape[1]):
+                collisions |= window_bits[i, w] & tdd_footprint_bits[j, w]
+            available[i, j] = (collisions == 0)
+
+
+if numba is not None:
+    _tour_available = numba.njit(parallel=True, cache=True)(_tour_available)
+    _tour_available_matrix = numba.njit(parallel=True, cache=True)(_tour_available_matrix)
+else:
+    _tour_available = None
+    _tour_available_matrix = None
+
+
 def tour_map(persons, tours, tdd_alts, persons_id_col='person_id'):
 
     sigil = {
@@ -214,7 +296,58 @@ class TimeTable(object):
 
         # we want range index so we can use raw numpy
         assert (tdd_alts_df.index == list(range(tdd_alts_df.shape[0]))).all()
-        self.tdd_footprints = np.asanyarray([list(r) for r in w_strings]).astype(int)
+        # window states all fit in int8 (same as windows) so store footprints compactly
+        self.tdd_footprints = np.asanyarray([list(r) for r in w_strings]).astype(np.int8)
+
+        # - bit-packed footprints and windows for fast collision checks (see BIT_STATES)
+        # shape (num_tdds, len(BIT_STATES), num_words)
+        self.tdd_footprint_bits = np.stack(
+            [pack_bits(self.tdd_footprints == state) for state in BIT_STATES], axis=1)
+        # window_bits are only built on first use by tour availability checks
+        # (models that only query windows, e.g. overlap, never need them)
+        self.window_bits = None
+
+    def get_window_bits(self):
+        """
+        Return bit-packed window_bits for all windows (building them if necessary)
+
+        Returns
+        -------
+        window_bits : numpy array of uint64
+            with shape (num_rows, len(BIT_STATES), num_words)
+        """
+
+        if self.window_bits is None:
+            self.window_bits = self.pack_window_bits(self.windows)
+
+        return self.window_bits
+
+    def pack_window_bits(self, windows):
+
+        # shape (num_rows, len(BIT_STATES), num_words)
+        return np.stack([pack_bits(COLLISION_TABLE[windows, state]) for state in BIT_STATES], axis=1)
+
+    def update_window_bits(self, row_ixs=None):
+        """
+        Update bit-packed window_bits to reflect current windows states
+
+        Must be called after windows are modified
+
+        Parameters
+        ----------
+        row_ixs : numpy array of int or None
+            windows row indexes of modified windows (or None if all rows may have changed)
+        """
+
+        if self.window_bits is None:
+            # not built yet - get_window_bits will build them from current windows
+            return
+
+        if row_ixs is None:
+            # rebuilt on next use
+            self.window_bits = None
+        else:
+            self.window_bits[row_ixs] = self.pack_window_bits(self.windows[row_ixs])
 
     def begin_transaction(self, transaction_loggers):
         """
@@ -236,9 +369,20 @@ class TimeTable(object):
             logger.log("timetable.rollback %s" % self.windows_table_name)
         self.windows_df = self.checkpoint_df
         self.windows = self.windows_df.values
+        self.update_window_bits()
         self.checkpoint_df = None
         self.transaction_loggers = None
 
+    def get_window_row_ixs(self, window_row_ids):
+        """
+        return int32 array of windows row indexes for specified window_row_ids
+        (in window_row_ids order)
+        """
+        row_ixs = self.window_row_ix.index.get_indexer(window_row_ids)
+        assert (row_ixs >= 0).all()
+
+        return row_ixs.astype(np.int32)
+
     def slice_windows_by_row_id(self, window_row_ids):
         """
         return windows array slice containing rows for specified window_row_ids
@@ -310,20 +454,95 @@ class TimeTable(object):
 
         assert len(window_row_ids) == len(tdds)
 
+        row_ixs = self.get_window_row_ixs(window_row_ids)
+        available = self.tour_available_by_row_ix(row_ixs, tdds.values)
+        available = pd.Series(available, index=window_row_ids.index)
+
+        return available
+
+    def tour_available_by_row_ix(self, row_ixs, tdds):
+        """
+        Like tour_available, but for windows row indexes (e.g. from get_window_row_ixs)
+        rather than window_row_ids, which avoids mapping ids for every tour and tdd pair
+
+        Parameters
+        ----------
+        row_ixs : numpy array of int
+            windows row indexes
+        tdds : numpy array of int
+            tdd_alt ids (one per row_ix)
+
+        Returns
+        -------
+        available : numpy array of bool
+        """
+
+        assert len(row_ixs) == len(tdds)
+
+        tdds = tdds.astype(int, copy=False)
+
+        # numba kernel doesn't bounds check, so bad ids must not get that far
+        assert ((tdds >= 0) & (tdds < self.tdd_footprints.shape[0])).all()
+        assert ((row_ixs >= 0) & (row_ixs < self.windows.shape[0])).all()
+
+        if _tour_available is not None:
+            available = np.empty(len(row_ixs), dtype=bool)
+            _tour_available(row_ixs, tdds, self.get_window_bits(), self.tdd_footprint_bits, available)
+            return available
+
         # numpy array with one tdd_footprints_df row for tdds
-        tour_footprints = self.tdd_footprints[tdds.values.astype(int)]
+        tour_footprints = self.tdd_footprints[tdds]
 
         # numpy array with one windows row for each person
-        windows = self.slice_windows_by_row_id(window_row_ids)
+        windows = self.windows[row_ixs]
 
-        # t0 = tracing.print_elapsed_time("slice_windows_by_row_id", t0, debug=True)
+        # table lookup of collisions is much cheaper than np.isin(x, COLLISION_LIST)
+        # where x = tour_footprints + (windows << I_BIT_SHIFT)
+        available = ~COLLISION_TABLE[windows, tour_footprints].any(axis=1)
 
-        x = tour_footprints + (windows << I_BIT_SHIFT)
+        return available
 
-        available = ~np.isin(x, COLLISION_LIST).any(axis=1)
-        available = pd.Series(available, index=window_row_ids.index)
+    def tour_available_matrix(self, row_ixs, tdds):
+        """
+        test whether time windows allow tours with each of the specified tdd alts
 
-        return available
+        Like tour_available_by_row_ix for the cartesian product of row_ixs and tdds, but without
+        building arrays of row_ixs and tdds for every pair. Availability is only checked once for
+        windows with identical states (e.g. all empty windows before the first tours are scheduled)
+
+        Parameters
+        ----------
+        row_ixs : numpy array of int
+            windows row indexes (e.g. from get_window_row_ixs)
+        tdds : numpy array of int
+            tdd_alt ids
+
+        Returns
+        -------
+        available : numpy array of bool
+            with shape (len(row_ixs), len(tdds))
+        """
+
+        window_bits = self.get_window_bits()[row_ixs]
+
+        num_words = window_bits.shape[1] * window_bits.shape[2]
+
+        window_bits = window_bits.reshape(len(row_ixs), num_words)
+        tdd_footprint_bits = self.tdd_footprint_bits[tdds.astype(int, copy=False)].reshape(-1, num_words)
+
+        # - check each distinct window once
+        window_bits, window_ixs = np.unique(window_bits, axis=0, return_inverse=True)
+
+        if _tour_available_matrix is not None:
+            available = np.empty((window_bits.shape[0], tdd_footprint_bits.shape[0]), dtype=bool)
+            _tour_available_matrix(window_bits, tdd_footprint_bits, available)
+        else:
+            collisions = np.zeros((window_bits.shape[0], tdd_footprint_bits.shape[0]), dtype=bool)
+            for w in range(num_words):
+                collisions |= (window_bits[:, w, None] & tdd_footprint_bits[None, :, w]) != 0
+            available = ~collisions
+
+        return available[window_ixs.ravel()]
 
     def assign(self, window_row_ids, tdds):
         """
@@ -343,7 +562,7 @@ class TimeTable(object):
         assert len(window_row_ids) == len(tdds)
 
         # vectorization doesn't work duplicates
-        assert len(window_row_ids.index) == len(np.unique(window_row_ids.values))
+        assert pd.Index(window_row_ids.values).is_unique
 
         # numpy array with one time window row for each person tdd
         tour_footprints = self.tdd_footprints[tdds.values.astype(int)]
@@ -352,6 +571,7 @@ class TimeTable(object):
         row_ixs = window_row_ids.map(self.window_row_ix).values
 
         self.windows[row_ixs] = np.bitwise_or(self.windows[row_ixs], tour_footprints)
+        self.update_window_bits(row_ixs)
 
     def assign_subtour_mask(self, window_row_ids, tdds):
         """
@@ -389,6 +609,7 @@ class TimeTable(object):
         row_ixs = window_row_ids.map(self.window_row_ix).values
 
         self.windows[row_ixs] = (tour_footprints == 0) * I_MIDDLE
+        self.update_window_bits()
 
     def assign_footprints(self, window_row_ids, footprints):
         """
@@ -411,12 +632,13 @@ class TimeTable(object):
         assert self.windows.shape[1] == footprints.shape[1]
 
         # vectorization doesn't work with duplicate row_ids
-        assert len(window_row_ids.values) == len(np.unique(window_row_ids.values))
+        assert pd.Index(window_row_ids.values).is_unique
 
         # row idxs of windows to assign to
         row_ixs = window_row_ids.map(self.window_row_ix).values
 
         self.windows[row_ixs] = np.bitwise_or(self.windows[row_ixs], footprints)
+        self.update_window_bits(row_ixs)
 
     def pairwise_available(self, window1_row_ids, window2_row_ids):
 
@@ -158,6 +158,47 @@ def other_than(groups, bools):
     return gt1.where(bools, other=gt0)
 
 
+def iter_groups(df, by):
+    """
+    Faster replacement for iterating over df.groupby(by, sort=True)
+
+    Rather than hashing group keys and slicing df once per group, sort df once (stable, so
+    group rows stay in df order) and yield iloc slices between group boundaries.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    by : str or list of str
+        name(s) of df columns to group by
+
+    Returns
+    -------
+    generator yielding (key, group) tuples, where key is a scalar if by is a str,
+        or a tuple if by is a list (just like groupby)
+    """
+
+    cols = [by] if isinstance(by, str) else list(by)
+
+    if len(df.index) == 0:
+        return
+
+    # mergesort is stable for single column and multi-column sorts use (stable) lexsort
+    df = df.sort_values(cols, kind='mergesort')
+
+    # row offsets where any of the group columns changes value
+    starts = np.zeros(len(df.index), dtype=bool)
+    starts[0] = True
+    for c in cols:
+        values = df[c].values
+        starts[1:] |= (values[1:] != values[:-1])
+    boundaries = np.append(np.flatnonzero(starts), len(df.index))
+
+    for i in range(len(boundaries) - 1):
+        group = df.iloc[boundaries[i]:boundaries[i + 1]]
+        key = tuple(group[c].iat[0] for c in cols)
+        yield (key[0] if isinstance(by, str) else key), group
+
+
 def quick_loc_df(loc_list, target_df, attribute=None):
     """
     faster replacement for target_df.loc[loc_list] or target_df.loc[loc_list][attribute]